@@ -11,10 +11,15 @@ class Config:
     # Monitoring Settings
     MONITORING_CYCLE_INTERVAL = int(os.getenv('MONITORING_CYCLE_INTERVAL', '10'))  # minutes between checks
     ALERT_COOLDOWN_HOURS = int(os.getenv('ALERT_COOLDOWN_HOURS', '6'))  # hours before re-alerting same card
+    REPEAT_ALERT_WINDOW_MINUTES = int(os.getenv('REPEAT_ALERT_WINDOW_MINUTES', '60'))  # minutes an identical alert stays suppressed
+    FUTBIN_REQUEST_INTERVAL = float(os.getenv('FUTBIN_REQUEST_INTERVAL', '1.0'))  # minimum seconds between any two Futbin requests
     
     # Scraping Settings
     MAX_PAGES_TO_SCRAPE = int(os.getenv('MAX_PAGES_TO_SCRAPE', '10'))  # pages to scrape initially
+    PAGE_SCRAPE_WORKERS = int(os.getenv('PAGE_SCRAPE_WORKERS', '4'))  # list pages fetched in parallel
+    PRICE_CHECK_WORKERS = int(os.getenv('PRICE_CHECK_WORKERS', '4'))  # card price pages fetched in parallel
     CARDS_TO_MONITOR_PER_CYCLE = int(os.getenv('CARDS_TO_MONITOR_PER_CYCLE', '30'))  # cards per monitoring cycle
+    MAX_ALERTS_PER_CYCLE = int(os.getenv('MAX_ALERTS_PER_CYCLE') or '0')  # stop a cycle early after this many alerts (0 = no cap)
     
     # Advanced Settings
     SKIP_SCRAPING = os.getenv('SKIP_SCRAPING', 'false').lower() == 'true'
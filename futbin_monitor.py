@@ -1,14 +1,133 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import time
 import json
 import sqlite3
 from datetime import datetime, timedelta
+from collections import ChainMap, Counter, OrderedDict
 import random
-from bs4 import BeautifulSoup
+import heapq
+import itertools
+import functools
+import re
+from lxml import etree, html
 import os
 import threading
+import atexit
+import signal
+import queue
+from concurrent.futures import ThreadPoolExecutor, wait
 from config import Config
 
+# Price text like "15000", "1.5K" or "1.2M" (commas/spaces removed first)
+PRICE_TEXT_STRIP = str.maketrans('', '', ', \u00a0')
+PRICE_TEXT_RE = re.compile(r'(\d+(?:\.\d+)?)([KkMm]?)')
+PRICE_SUFFIX_MULTIPLIERS = {'': 1, 'K': 1000, 'k': 1000, 'M': 1000000, 'm': 1000000}
+
+# Static INSERT prefixes - VALUES groups are appended per batch (see execute_multi_row_insert)
+CARD_INSERT_PREFIX = '''INSERT OR IGNORE INTO cards 
+    (name, rating, position, club, nation, league, card_type, futbin_url, futbin_id)
+    VALUES '''
+PRICE_ALERT_INSERT_PREFIX = '''INSERT INTO price_alerts 
+    (card_id, platform, buy_price, sell_price, sell_price_after_tax, profit_after_tax, percentage_profit, ea_tax)
+    VALUES '''
+PRICE_PAGE_CACHE_INSERT_PREFIX = '''INSERT OR REPLACE INTO price_page_cache 
+    (futbin_url, etag, last_modified, prices)
+    VALUES '''
+SQLITE_MAX_VARIABLES = 999  # Lowest bound-parameter limit across SQLite builds
+
+MAX_PRICE_PAGE_BYTES = 2000000  # Card pages are far smaller - anything bigger is an error dump
+PRICE_PAGE_CHUNK_BYTES = 65536
+RECENT_ALERT_KEYS_LIMIT = 10000  # Most (card_id, platform, buy_price) alerts remembered for repeat checks
+
+# Players list selectors - compiled once, evaluated by lxml in C
+XP_PLAYERS_TABLE = etree.XPath("//table[@class='futbin-table players-table']")
+XP_ANY_FUTBIN_TABLE = etree.XPath("//table[contains(concat(' ', normalize-space(@class), ' '), ' futbin-table ')]")
+XP_BORDERED_TBODY = etree.XPath(".//tbody[@class='with-border with-background']")
+XP_TBODY = etree.XPath(".//tbody")
+XP_ROWS = etree.XPath(".//tr")
+XP_TEXT_CELLS = etree.XPath(".//td[normalize-space(.)]")  # Cells with any non-whitespace text
+XP_PLAYER_LINKS = etree.XPath(".//a[contains(@href, '/player/')]")
+RATING_RE = re.compile(r'\b([4-9][0-9])\b')
+
+# Card page BIN prices - same matches, in document order, as the CSS selector
+# '.price.inline-with-icon.lowest-price-1, .lowest-price.inline-with-icon'
+HAS_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+XP_BIN_PRICES = etree.XPath(
+    "//*[({price} and {icon} and {first}) or ({lowest} and {icon})]".format(
+        price=HAS_CLASS.format('price'),
+        icon=HAS_CLASS.format('inline-with-icon'),
+        first=HAS_CLASS.format('lowest-price-1'),
+        lowest=HAS_CLASS.format('lowest-price')
+    )
+)
+# Player image lookups, tried in order
+XP_OG_IMAGE = etree.XPath("//meta[@property='og:image']")
+XP_PLAYER_IMAGES = [
+    etree.XPath("//img[{}]".format(HAS_CLASS.format('player-img'))),
+    etree.XPath("//img[@id='player-img']"),
+    etree.XPath("//img[contains(@src, 'players')]")
+]
+PLAYER_ID_RE = re.compile(r'/player/([^/?#]+)')  # Futbin id segment, relative or absolute URL
+LETTER_RE = re.compile(r'[^\W\d_]')  # Any Unicode letter, like str.isalpha on one character
+
+# Alert layouts are constant - only the fields change per alert
+TELEGRAM_ALERT_TEMPLATE = """🚨 {profit_emoji} TRADING OPPORTUNITY - {profit_quality} 🚨
+
+🃏 **{name}**
+📱 Platform: {platform}
+⭐ Rating: {rating} | 🏆 {position}
+🏟️ {club} | 🌍 {nation}
+
+💸 **TRADING DETAILS:**
+├─ 🛒 Buy Price: {buy_price:,} coins
+├─ 🏷️ Sell Price: {sell_price:,} coins
+├─ 💸 EA Tax (5%): -{ea_tax:,} coins
+├─ 💰 After Tax: {sell_price_after_tax:,} coins
+└─ 🎯 **PROFIT: {profit_after_tax:,} coins ({profit_margin:.1f}%)**
+
+📊 **STRATEGY:**
+1️⃣ Buy at: {buy_price:,} coins (lowest BIN)
+2️⃣ Sell at: {sell_price:,} coins (2nd lowest)
+3️⃣ Profit: {profit_after_tax:,} coins after tax
+
+🔗 {futbin_url}
+⏰ {time}
+
+⚡ **Quick Math:**
+Raw Profit: {raw_profit:,} | EA Tax: {ea_tax:,} | Net: {profit_after_tax:,}"""
+
+DISCORD_ALERT_TEMPLATE = """**Player**
+{player_name}
+**Platform**
+{platform}
+**Market Price**
+{sell_price:,}
+**Buy Price**
+{buy_price:,}
+**Profit (Untaxed)**
+{raw_profit:,}
+**Profit (-5%)**
+{profit_after_tax:,}
+**Link**
+[FutBin]({futbin_url})"""
+
+@functools.lru_cache(maxsize=256)
+def multi_row_insert_sql(insert_prefix, columns, rows):
+    """Build (once per shape) an INSERT with `rows` VALUES groups - identical text reuses SQLite's prepared statement"""
+    row_placeholders = '(' + ', '.join('?' * columns) + ')'
+    return insert_prefix + ', '.join([row_placeholders] * rows)
+
+def card_type_for_rating(rating):
+    """Futbin card tier for a rating - shared by both list-page extractors"""
+    if rating >= 75:
+        return 'Gold'
+    if rating >= 65:
+        return 'Silver'
+    return 'Bronze'
+
 # Test environment variables immediately
 print(f"🔑 Bot token available: {'Yes' if Config.TELEGRAM_BOT_TOKEN else 'No'}")
 print(f"💬 Chat ID available: {'Yes' if Config.TELEGRAM_CHAT_ID else 'No'}")
@@ -48,7 +167,28 @@ class FutbinPriceMonitor:
             self.db_path = "/tmp/futbin_cards.db"
             print(f"🔄 Using fallback database path: {self.db_path}")
         
+        # One pooled session for Futbin, Telegram and Discord so connections get reused
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=False,  # A 429's Retry-After would sleep a worker past stop(); pacing is wait_for_futbin_slot's job
+                raise_on_status=False  # Hand the final response back so callers can check status_code
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept-Encoding': ACCEPT_ENCODING,  # gzip/deflate, plus br/zstd when their decoders are installed
+            'Connection': 'keep-alive'
+        })
+        
+        # Notification endpoints don't change at runtime - resolve them once
+        self.telegram_url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/sendMessage"
+        self.discord_webhook_url = Config.DISCORD_WEBHOOK_URL or os.getenv('DISCORD_WEBHOOK_URL')
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -56,22 +196,97 @@ class FutbinPriceMonitor:
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0'
         ]
+        # One long-lived connection shared by every database call
+        # Multi-row INSERTs come in one statement per batch size, so keep more than the default 128 prepared
+        self.db = self.connect_db(check_same_thread=False, cached_statements=512)
+        self.db_lock = threading.Lock()
+        atexit.register(self.close_db)
+        
         self.init_database()
+        
+        # Price gap thresholds are fixed for the process, so read them once
+        # instead of on every analyze_price_gap call
+        self.min_card_price = getattr(Config, 'MINIMUM_CARD_PRICE', 1000)
+        self.min_gap_coins = getattr(Config, 'MINIMUM_PRICE_GAP_COINS', 5000)
+        self.min_gap_percentage = getattr(Config, 'MINIMUM_PRICE_GAP_PERCENTAGE', 10)
+        
+        # Same for the alert windows checked once per card in run_price_monitoring and send_price_alert
+        self.alert_cooldown_minutes = getattr(Config, 'ALERT_COOLDOWN_MINUTES', 30)
+        self.alert_cooldown_seconds = self.alert_cooldown_minutes * 60
+        self.repeat_alert_window_seconds = getattr(Config, 'REPEAT_ALERT_WINDOW_MINUTES', 60) * 60
+        
+        # Futbin requests from every worker share one schedule, at least this many seconds apart
+        self.futbin_request_interval = getattr(Config, 'FUTBIN_REQUEST_INTERVAL', 1.0)
+        self.futbin_request_lock = threading.Lock()
+        self.next_futbin_request = 0.0  # time.monotonic() of the next free request slot
+        
+        # Per-page scrape diagnostics are noisy across 100 pages - only print them when debugging
+        self.debug = getattr(Config, 'DEBUG', os.getenv('DEBUG', 'false').lower() == 'true')
+        
+        # In-memory alert cooldowns: (card_id, platform) -> time.monotonic() of last alert
+        self.alert_cooldowns = {}
+        self.pending_alert_rows = []  # price_alerts rows waiting for the next batch insert
+        atexit.register(self.flush_alert_rows)  # Registered after close_db, so atexit runs it first
+        # (card_id, platform, buy_price) -> time.monotonic() of last alert, oldest first
+        self.recent_alert_keys = OrderedDict()
+        self.load_alert_cooldowns()
+        self.alert_hit_counts = Counter()  # card_id -> alerts ever sent, so proven cards are checked first
+        self.load_alert_hit_counts()
+        
+        # futbin_url -> (etag, last_modified, prices) so unchanged card pages come back as 304s
+        self.price_page_cache = {}
+        self.dirty_price_pages = {}  # Entries changed since the last flush_price_page_cache
+        self.load_price_page_cache()
+        
         self.startup_sent = False  # Flag to prevent duplicate startup messages
+        self.stop_event = threading.Event()  # Set by stop() to end scraping and monitoring early
+        self.wakeup_event = threading.Event()  # Set by wake() or stop() to cut the wait between cycles short
+        self.seen_urls = None  # futbin_urls already in the database (loaded lazily)
+        self.player_images = {}  # futbin_url -> og:image seen by scrape_card_prices
+        
+        # Trading alerts are queued during a cycle and posted in batches by a background thread
+        self.pending_alerts = []
+        self.notification_queue = queue.Queue()
+        self.notify_pool = ThreadPoolExecutor(max_workers=4)  # Telegram and Discord posts run side by side
+        self.notification_thread = threading.Thread(target=self.notification_worker, daemon=True)
+        self.notification_thread.start()
     
-    def rotate_user_agent(self):
-        """Rotate user agent to avoid detection"""
-        self.session.headers.update({
-            'User-Agent': random.choice(self.user_agents)
-        })
+    def connect_db(self, **kwargs):
+        """Open a SQLite connection with the write-optimized per-connection settings"""
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.execute('PRAGMA synchronous=NORMAL')  # Safe with WAL, one fsync per checkpoint
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+        conn.execute('PRAGMA mmap_size=268435456')  # 256 MB memory-mapped reads
+        return conn
+    
+    def checkpoint_db(self):
+        """Fold the WAL back into the database file and truncate it, then refresh stale planner stats"""
+        try:
+            with self.db_lock:
+                self.db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+                self.db.execute('PRAGMA optimize')
+        except sqlite3.Error as e:
+            print(f"⚠️ Database checkpoint failed: {e}")
+    
+    def close_db(self):
+        """Refresh planner stats SQLite flagged as stale, then close the shared connection"""
+        try:
+            with self.db_lock:
+                self.db.execute('PRAGMA optimize')
+        except sqlite3.Error as e:
+            print(f"⚠️ PRAGMA optimize failed: {e}")
+        self.db.close()
     
     def init_database(self):
         """Initialize SQLite database (YOUR own database!)"""
         print(f"🔧 Initializing database at: {self.db_path}")
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            cursor = self.db.cursor()
+            
+            # WAL is stored in the database file, so every later connection uses it
+            cursor.execute('PRAGMA journal_mode=WAL')
             
             print("📋 Creating cards table...")
             cursor.execute('''
@@ -91,6 +306,12 @@ class FutbinPriceMonitor:
                 )
             ''')
             
+            # Lets get_cards_to_monitor seek its rating ranges instead of scanning the table
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_cards_rating_name
+                ON cards (rating DESC, name ASC)
+            ''')
+            
             print("📋 Creating price_alerts table...")
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS price_alerts (
@@ -108,6 +329,22 @@ class FutbinPriceMonitor:
                 )
             ''')
             
+            # Speeds up the recent-alert lookup used to seed cooldowns
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_price_alerts_card_platform_time
+                ON price_alerts (card_id, platform, alert_sent_at DESC)
+            ''')
+            
+            # HTTP validators and last parsed prices per card page, for conditional re-fetches
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS price_page_cache (
+                    futbin_url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    prices TEXT
+                )
+            ''')
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS startup_locks (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -116,14 +353,13 @@ class FutbinPriceMonitor:
                 )
             ''')
             
-            conn.commit()
+            self.db.commit()
             
             # Test if we can actually read/write
             cursor.execute('SELECT COUNT(*) FROM cards')
-            existing_cards = cursor.fetchone()[0]
-            print(f"📊 Database initialized! Existing cards: {existing_cards}")
+            self.existing_card_count = cursor.fetchone()[0]
+            print(f"📊 Database initialized! Existing cards: {self.existing_card_count}")
             
-            conn.close()
             print("✅ Database initialization successful!")
             
         except Exception as e:
@@ -142,16 +378,12 @@ class FutbinPriceMonitor:
         instance_id = f"{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}_{os.getpid()}_{uuid.uuid4().hex[:8]}"
         
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            # Use a more aggressive lock to prevent race conditions
-            cursor.execute('''
-                INSERT INTO startup_locks (instance_id, startup_time)
-                VALUES (?, ?)
-            ''', (instance_id, datetime.now()))
-            
-            conn.commit()
+            with self.db_lock, self.db:
+                # Use a more aggressive lock to prevent race conditions
+                self.db.execute('''
+                    INSERT INTO startup_locks (instance_id, startup_time)
+                    VALUES (?, ?)
+                ''', (instance_id, datetime.now()))
             
             # If we got here, we successfully claimed the startup lock
             print(f"✅ Startup lock acquired: {instance_id}")
@@ -168,7 +400,7 @@ class FutbinPriceMonitor:
             )
             
             self.startup_sent = True
-            print("✅ Startup notification sent")
+            print("✅ Startup notification queued")  # Delivery errors are logged by notification_worker
             
         except sqlite3.IntegrityError:
             # Another instance already claimed the startup lock
@@ -178,61 +410,71 @@ class FutbinPriceMonitor:
             print(f"Error with startup notification: {e}")
             # Don't block the bot if notification fails
             self.startup_sent = True
-        finally:
-            try:
-                conn.close()
-            except:
-                pass
     
     def scrape_futbin_cards_list(self, page_num):
         """Scrape cards from a Futbin players page - Updated for current structure"""
         try:
-            self.rotate_user_agent()
-            
             url = f'https://www.futbin.com/players?page={page_num}'
-            print(f"🌐 Fetching: {url}")
-            response = self.session.get(url)
+            if self.debug:
+                print(f"🌐 Fetching: {url}")
+            # Per-request User-Agent so concurrent workers don't race on session headers
+            response = self.session.get(
+                url, headers={'User-Agent': random.choice(self.user_agents)}, stream=True, timeout=(3, 10)
+            )
             
-            if response.status_code != 200:
-                print(f"❌ Failed to get page {page_num}: {response.status_code}")
+            with response:
+                if response.status_code != 200:
+                    print(f"❌ Failed to get page {page_num}: {response.status_code}")
+                    return []
+                
+                # Feed the socket straight into lxml so parsing overlaps the download
+                # and the page is never held as one big bytes object
+                response.raw.decode_content = True  # urllib3 undoes gzip/deflate as it reads
+                # requests reports ISO-8859-1 for any text/* without a charset; Futbin serves UTF-8
+                has_charset = 'charset' in response.headers.get('Content-Type', '')
+                parser = html.HTMLParser(encoding=(has_charset and response.encoding) or 'utf-8')
+                doc = html.parse(response.raw, parser=parser).getroot()
+                downloaded = response.raw.tell()
+            
+            if doc is None:
+                print(f"❌ Page {page_num} returned an empty document")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
             cards = []
             
-            print(f"📄 Page {page_num} - Content length: {len(response.content)} bytes")
+            if self.debug:
+                print(f"📄 Page {page_num} - Downloaded {downloaded} bytes")
             
             # Look for the main players table
-            players_table = soup.find('table', class_='futbin-table players-table')
-            if not players_table:
-                players_table = soup.find('table', class_='futbin-table')
+            players_table = (XP_PLAYERS_TABLE(doc) or XP_ANY_FUTBIN_TABLE(doc) or [None])[0]
             
-            if players_table:
-                print("✅ Found futbin-table")
+            if players_table is not None:
+                if self.debug:
+                    print("✅ Found futbin-table")
                 
                 # Look for tbody with player rows
-                tbody = players_table.find('tbody', class_='with-border with-background')
-                if not tbody:
-                    tbody = players_table.find('tbody')
+                tbody = (XP_BORDERED_TBODY(players_table) or XP_TBODY(players_table) or [None])[0]
                 
-                if tbody:
-                    print("✅ Found tbody section")
+                if tbody is not None:
+                    if self.debug:
+                        print("✅ Found tbody section")
                     
                     # Find all table rows in tbody
-                    player_rows = tbody.find_all('tr')
-                    print(f"🔍 Found {len(player_rows)} rows in tbody")
+                    player_rows = XP_ROWS(tbody)
+                    if self.debug:
+                        print(f"🔍 Found {len(player_rows)} rows in tbody")
                     
                     for i, row in enumerate(player_rows):
                         try:
                             # Look for player links in this row
-                            player_links = row.find_all('a', href=lambda x: x and '/player/' in str(x))
+                            player_links = XP_PLAYER_LINKS(row)
                             
                             if player_links:
                                 # Extract data from the row
                                 card_data = self.extract_card_from_row(row, player_links)
                                 if card_data:
                                     cards.append(card_data)
-                                    if i < 3:  # Show first 3 for debugging
+                                    if self.debug and i < 3:  # Show first 3 for debugging
                                         print(f"✅ Extracted: {card_data['name']} ({card_data['rating']})")
                         except Exception as e:
                             print(f"Error processing row {i}: {e}")
@@ -243,8 +485,9 @@ class FutbinPriceMonitor:
                 print("❌ No futbin-table found, trying alternative approach...")
                 
                 # Fallback: Look for any player links on the page
-                all_player_links = soup.find_all('a', href=lambda x: x and '/player/' in str(x))
-                print(f"🔗 Found {len(all_player_links)} total player links on page")
+                all_player_links = XP_PLAYER_LINKS(doc)
+                if self.debug:
+                    print(f"🔗 Found {len(all_player_links)} total player links on page")
                 
                 if len(all_player_links) == 0:
                     print("❌ CRITICAL: No player links found at all - Futbin structure has likely changed")
@@ -257,12 +500,13 @@ class FutbinPriceMonitor:
                     if href not in unique_players:
                         unique_players[href] = {
                             'url': href,
-                            'texts': [link.get_text(strip=True)]
+                            'texts': [self.element_text(link)]
                         }
                     else:
-                        unique_players[href]['texts'].append(link.get_text(strip=True))
+                        unique_players[href]['texts'].append(self.element_text(link))
                 
-                print(f"🔗 Found {len(unique_players)} unique player URLs")
+                if self.debug:
+                    print(f"🔗 Found {len(unique_players)} unique player URLs")
                 
                 # Convert to card format
                 for url, data in unique_players.items():
@@ -273,7 +517,8 @@ class FutbinPriceMonitor:
                     except Exception as e:
                         continue
             
-            print(f"✅ Page {page_num}: Extracted {len(cards)} cards total")
+            if self.debug:
+                print(f"✅ Page {page_num}: Extracted {len(cards)} cards total")
             return cards
             
         except Exception as e:
@@ -316,6 +561,10 @@ class FutbinPriceMonitor:
             print(f"Error extracting name from URL {futbin_url}: {e}")
             return None
     
+    def element_text(self, element):
+        """Stripped text of an lxml element, joined like BeautifulSoup's get_text(strip=True)"""
+        return ''.join(text.strip() for text in element.itertext())
+    
     def extract_card_from_row(self, row, player_links):
         """Extract card data from a table row"""
         try:
@@ -324,31 +573,26 @@ class FutbinPriceMonitor:
             href = main_link.get('href', '')
             
             # Extract player name from link text or nearby elements
-            name = main_link.get_text(strip=True)
+            name = self.element_text(main_link)
             if not name or len(name) < 2:
                 # Try to find name in other cells
-                name_cells = row.find_all('td')
+                name_cells = XP_TEXT_CELLS(row)
                 for cell in name_cells:
-                    cell_text = cell.get_text(strip=True)
-                    if cell_text and len(cell_text) > 2 and any(c.isalpha() for c in cell_text):
+                    cell_text = self.element_text(cell)
+                    if cell_text and len(cell_text) > 2 and LETTER_RE.search(cell_text):
                         if not cell_text.isdigit():
                             name = cell_text
                             break
             
             # Extract rating - look for number between 40-99
             rating = 0
-            all_text = row.get_text()
-            import re
-            rating_matches = re.findall(r'\b([4-9][0-9])\b', all_text)
-            if rating_matches:
-                rating = int(rating_matches[0])
+            rating_match = RATING_RE.search(row.text_content())
+            if rating_match:
+                rating = int(rating_match.group(1))
             
             # Extract futbin ID from URL
-            futbin_id = None
-            if '/player/' in href:
-                url_parts = href.split('/')
-                if len(url_parts) >= 4:
-                    futbin_id = url_parts[3]
+            id_match = PLAYER_ID_RE.search(href)
+            futbin_id = id_match.group(1) if id_match else None
             
             if name and rating > 0 and futbin_id:
                 futbin_url = 'https://www.futbin.com' + href if href.startswith('/') else href
@@ -360,7 +604,7 @@ class FutbinPriceMonitor:
                     'club': '',
                     'nation': '',
                     'league': '',
-                    'card_type': 'Gold' if rating >= 75 else 'Silver' if rating >= 65 else 'Bronze',
+                    'card_type': card_type_for_rating(rating),
                     'futbin_url': futbin_url,
                     'futbin_id': futbin_id
                 }
@@ -385,15 +629,12 @@ class FutbinPriceMonitor:
                     if text.isdigit() and 40 <= int(text) <= 99:
                         rating = int(text)
                     # If it's text and longer than current name
-                    elif len(text) > len(name) and any(c.isalpha() for c in text):
+                    elif len(text) > len(name) and LETTER_RE.search(text):
                         name = text
             
             # Extract futbin ID from URL
-            futbin_id = None
-            if '/player/' in url:
-                url_parts = url.split('/')
-                if len(url_parts) >= 4:
-                    futbin_id = url_parts[3]
+            id_match = PLAYER_ID_RE.search(url)
+            futbin_id = id_match.group(1) if id_match else None
             
             if name and rating > 0 and futbin_id:
                 futbin_url = 'https://www.futbin.com' + url if url.startswith('/') else url
@@ -405,7 +646,7 @@ class FutbinPriceMonitor:
                     'club': '',
                     'nation': '',
                     'league': '',
-                    'card_type': 'Gold' if rating >= 75 else 'Silver' if rating >= 65 else 'Bronze',
+                    'card_type': card_type_for_rating(rating),
                     'futbin_url': futbin_url,
                     'futbin_id': futbin_id
                 }
@@ -417,57 +658,117 @@ class FutbinPriceMonitor:
     
     def save_cards_to_db(self, cards):
         """Save scraped cards to database"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        saved_count = 0
-        for card in cards:
+        with self.db_lock:
+            cursor = self.db.cursor()
+            
+            # Load known URLs once so duplicates from other pages never reach the DB
+            if self.seen_urls is None:
+                cursor.execute('SELECT futbin_url FROM cards')
+                self.seen_urls = {row[0] for row in cursor.fetchall()}
+            
+            new_cards = [card for card in cards if card['futbin_url'] not in self.seen_urls]
+            if not new_cards:
+                return 0
+            
+            # One explicit transaction + multi-row INSERTs for the whole batch
+            saved_count = 0
             try:
-                cursor.execute('''
-                    INSERT OR IGNORE INTO cards 
-                    (name, rating, position, club, nation, league, card_type, futbin_url, futbin_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    card['name'], card['rating'], card['position'], card['club'],
-                    card['nation'], card['league'], card['card_type'], 
-                    card['futbin_url'], card['futbin_id']
-                ))
-                if cursor.rowcount > 0:
-                    saved_count += 1
+                changes_before = self.db.total_changes
+                cursor.execute('BEGIN IMMEDIATE')
+                self.execute_multi_row_insert(cursor, CARD_INSERT_PREFIX, [
+                    (
+                        card['name'], card['rating'], card['position'], card['club'],
+                        card['nation'], card['league'], card['card_type'], 
+                        card['futbin_url'], card['futbin_id']
+                    )
+                    for card in new_cards
+                ])
+                self.db.commit()
+                saved_count = self.db.total_changes - changes_before
+                self.seen_urls.update(card['futbin_url'] for card in new_cards)
             except Exception as e:
-                print(f"Error saving card {card['name']}: {e}")
+                self.db.rollback()
+                print(f"Error saving {len(new_cards)} cards: {e}")
         
-        conn.commit()
-        conn.close()
         return saved_count
     
+    def execute_multi_row_insert(self, cursor, insert_prefix, rows):
+        """Insert rows using as few multi-row VALUES statements as SQLite's parameter limit allows"""
+        if not rows:
+            return
+        
+        columns = len(rows[0])
+        rows_per_statement = SQLITE_MAX_VARIABLES // columns
+        
+        for start in range(0, len(rows), rows_per_statement):
+            chunk = rows[start:start + rows_per_statement]
+            cursor.execute(
+                multi_row_insert_sql(insert_prefix, columns, len(chunk)),
+                list(itertools.chain.from_iterable(chunk))
+            )
+    
+    def fetch_cards_page(self, page):
+        """Scrape one players page from a worker thread, keeping the per-worker delay"""
+        if self.stop_event.is_set():
+            return []
+        
+        started = time.monotonic()
+        print(f"📄 Scraping page {page}...")
+        self.wait_for_futbin_slot()
+        cards = self.scrape_futbin_cards_list(page)
+        
+        # Random 2-5 second gap between pages per worker, counting the scrape time
+        elapsed = time.monotonic() - started
+        self.stop_event.wait(max(0, random.uniform(2, 5) - elapsed))
+        
+        return cards
+    
     def scrape_all_cards(self):
         """Scrape cards from all pages"""
         pages_to_scrape = getattr(Config, 'PAGES_TO_SCRAPE', 50)
         print(f"🚀 Starting to scrape {pages_to_scrape} pages...")
         
         total_saved = 0
+        page_scrape_workers = getattr(Config, 'PAGE_SCRAPE_WORKERS', 4)
         
-        for page in range(1, pages_to_scrape + 1):
+        # Fetch pages concurrently; DB writes stay on this thread
+        with ThreadPoolExecutor(max_workers=page_scrape_workers) as executor:
+            pages = range(1, pages_to_scrape + 1)
             try:
-                print(f"📄 Scraping page {page}/{pages_to_scrape}...")
-                
-                cards = self.scrape_futbin_cards_list(page)
-                if cards:
-                    saved = self.save_cards_to_db(cards)
-                    total_saved += saved
-                    print(f"✅ Page {page}: Found {len(cards)} cards, saved {saved} new cards")
-                else:
-                    print(f"⚠️ Page {page}: No cards found")
-                
-                # Random delay between pages
-                time.sleep(random.uniform(2, 5))
-                
-            except Exception as e:
-                print(f"❌ Error on page {page}: {e}")
-                continue
+                for page, cards in zip(pages, executor.map(self.fetch_cards_page, pages)):
+                    if self.stop_event.is_set():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    
+                    try:
+                        if cards:
+                            saved = self.save_cards_to_db(cards)
+                            total_saved += saved
+                            print(f"✅ Page {page}: Found {len(cards)} cards, saved {saved} new cards")
+                        else:
+                            print(f"⚠️ Page {page}: No cards found")
+                        
+                    except Exception as e:
+                        print(f"❌ Error on page {page}: {e}")
+                        continue
+            except BaseException:
+                # Ctrl-C: wake sleeping workers and drop the queued pages instead of fetching them all on exit
+                self.stop_event.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        if self.stop_event.is_set():
+            print(f"🛑 Scraping stopped early! Total cards saved: {total_saved}")
+            return total_saved
         
         print(f"🎉 Scraping complete! Total cards saved: {total_saved}")
+        
+        # Refresh query planner stats now that the cards table has grown
+        if total_saved:
+            with self.db_lock:
+                self.db.execute('ANALYZE')
+            self.checkpoint_db()
+        
         self.send_notification_to_all(
             f"🎉 Futbin scraping complete!\n"
             f"📊 Pages scraped: {pages_to_scrape}\n"
@@ -481,132 +782,187 @@ class FutbinPriceMonitor:
     def scrape_card_prices(self, futbin_url):
         """Scrape current BIN prices from a card's individual Futbin page"""
         try:
-            self.rotate_user_agent()
-            response = self.session.get(futbin_url)
+            # Per-request User-Agent so concurrent workers don't race on session headers
+            headers = {'User-Agent': random.choice(self.user_agents)}
+            cached = self.price_page_cache.get(futbin_url)
+            if cached:
+                etag, last_modified, _ = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            response = self.session.get(futbin_url, headers=headers, stream=True, timeout=(3, 10))
             
-            if response.status_code != 200:
+            with response:
+                # Page unchanged since the last fetch - reuse its prices without downloading or parsing
+                if response.status_code == 304 and cached:
+                    return cached[2]
+                
+                if response.status_code != 200:
+                    return None
+                
+                # Refuse oversized pages up front, and never read more than the cap either way
+                if int(response.headers.get('Content-Length') or 0) > MAX_PRICE_PAGE_BYTES:
+                    print(f"⚠️ Skipping oversized page ({response.headers['Content-Length']} bytes): {futbin_url}")
+                    return None
+                
+                # Feed decoded chunks to lxml as they arrive instead of buffering the whole page.
+                # Pin the encoding like scrape_futbin_cards_list - without a <meta charset> lxml assumes Latin-1
+                has_charset = 'charset' in response.headers.get('Content-Type', '')
+                parser = html.HTMLParser(encoding=(has_charset and response.encoding) or 'utf-8')
+                received = 0
+                for chunk in response.iter_content(PRICE_PAGE_CHUNK_BYTES):
+                    received += len(chunk)
+                    if received > MAX_PRICE_PAGE_BYTES:
+                        print(f"⚠️ Skipping oversized page (over {MAX_PRICE_PAGE_BYTES} bytes): {futbin_url}")
+                        return None
+                    parser.feed(chunk)
+            
+            if not received:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            prices = {'ps': [], 'xbox': [], 'pc': []}
+            doc = parser.close()
             
-            # Get EXACTLY the first and second lowest prices
-            bin_prices = []
+            # Keep the card image while the page is parsed so alerts don't fetch it again
+            self.player_images[futbin_url] = self.extract_player_image(doc)
             
+            # Get EXACTLY the first and second lowest prices in a single pass:
             # First BIN price: class="price inline-with-icon lowest-price-1"
-            first_price_elem = soup.find(class_="price inline-with-icon lowest-price-1")
-            if first_price_elem:
-                try:
-                    first_price_text = first_price_elem.get_text(strip=True)
-                    first_price = self.parse_price_text(first_price_text)
-                    if first_price > 0:
-                        bin_prices.append(first_price)
-                except Exception as e:
-                    print(f"Error parsing first price: {e}")
-            
-            # Second BIN price: Find ONLY the first occurrence of "lowest-price inline-with-icon"
-            second_price_elements = soup.find_all(class_="lowest-price inline-with-icon")
-            if second_price_elements and len(second_price_elements) > 0:
-                try:
-                    # Take only the FIRST element (second lowest price)
-                    second_price_elem = second_price_elements[0]
-                    second_price_text = second_price_elem.get_text(strip=True)
-                    second_price = self.parse_price_text(second_price_text)
-                    if second_price > 0 and second_price != first_price:
-                        bin_prices.append(second_price)
-                except Exception as e:
-                    print(f"Error parsing second price: {e}")
-            
-            # ONLY use the first two prices - ignore 3rd, 4th, etc.
+            # Second BIN price: ONLY the first occurrence of "lowest-price inline-with-icon"
+            first_price = None
+            second_price = None
+            for price_elem in XP_BIN_PRICES(doc):
+                classes = price_elem.get('class', '').split()
+                if first_price is None and 'lowest-price-1' in classes:
+                    first_price = self.parse_price_text(self.element_text(price_elem))
+                elif second_price is None and 'lowest-price' in classes:
+                    second_price = self.parse_price_text(self.element_text(price_elem))
+
+                if first_price is not None and second_price is not None:
+                    break  # Ignore 3rd, 4th, etc.
+
+            # Dedup identical prices and drop unparseable ones
+            bin_prices = {price for price in (first_price, second_price) if price and price > 0}
+
             if len(bin_prices) >= 2:
-                # Sort to ensure first is lowest, second is second lowest
-                bin_prices = sorted(bin_prices[:2])
-                prices['ps'] = bin_prices
-                return prices
+                # Sort to ensure first is lowest, second is second lowest.
+                # Only platforms with prices are returned, as a (lowest, second) tuple
+                prices = {'ps': tuple(sorted(bin_prices))}
             else:
-                return None
+                prices = None
+            
+            self.remember_price_page(futbin_url, response, prices)
+            return prices
             
         except Exception as e:
             print(f"Error scraping prices from {futbin_url}: {e}")
             return None
     
-    def parse_price_text(self, price_text):
-        """Parse price text into integer coins"""
+    def remember_price_page(self, futbin_url, response, prices):
+        """Keep a card page's cache validators and parsed prices for the next conditional fetch"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        
+        entry = (etag, last_modified, prices)
+        self.price_page_cache[futbin_url] = entry
+        self.dirty_price_pages[futbin_url] = entry
+    
+    def load_price_page_cache(self):
+        """Load cached card page validators so conditional fetches survive restarts"""
+        with self.db_lock:
+            rows = self.db.execute('SELECT futbin_url, etag, last_modified, prices FROM price_page_cache').fetchall()
+        
+        for futbin_url, etag, last_modified, prices in rows:
+            prices = json.loads(prices) if prices else None
+            if prices:
+                prices = {platform: tuple(price_list) for platform, price_list in prices.items()}
+            self.price_page_cache[futbin_url] = (etag, last_modified, prices)
+    
+    def flush_price_page_cache(self):
+        """Persist changed card page cache entries in a single transaction"""
+        if not self.dirty_price_pages:
+            return
+        
+        entries = self.dirty_price_pages
+        self.dirty_price_pages = {}
+        rows = [
+            (futbin_url, etag, last_modified, json.dumps(prices))
+            for futbin_url, (etag, last_modified, prices) in entries.items()
+        ]
+        
         try:
-            # Clean the price text
-            cleaned = price_text.replace(',', '').replace(' ', '').upper()
-            
-            # Handle different formats
-            if 'K' in cleaned:
-                # Handle "1.5K", "15K", etc.
-                number = float(cleaned.replace('K', ''))
-                return int(number * 1000)
-            elif 'M' in cleaned:
-                # Handle "1.2M", "15M", etc.
-                number = float(cleaned.replace('M', ''))
-                return int(number * 1000000)
-            else:
-                # Direct number
-                return int(cleaned)
-        except:
+            with self.db_lock, self.db:
+                self.execute_multi_row_insert(self.db.cursor(), PRICE_PAGE_CACHE_INSERT_PREFIX, rows)
+        except Exception as e:
+            print(f"❌ Error saving {len(rows)} price page cache entries: {e}")
+    
+    def parse_price_text(self, price_text):
+        """Parse price text into integer coins ("15,000", "1.5K", "1.2M")"""
+        match = PRICE_TEXT_RE.fullmatch(price_text.translate(PRICE_TEXT_STRIP))
+        if not match:
             return 0
+        return int(float(match.group(1)) * PRICE_SUFFIX_MULTIPLIERS[match.group(2)])
+    
     def analyze_price_gap(self, prices_list, card_id=None):
         """Analyze price gap between first and second lowest prices"""
         if len(prices_list) < 2:
             return None
         
-        # Sort to ensure we have lowest prices first
-        sorted_prices = sorted(prices_list)
-        buy_price = sorted_prices[0]  # First (lowest) price - what we buy for
-        sell_price = sorted_prices[1]  # Second price - what we sell for
+        # Only the two lowest prices matter - no need to sort the whole list
+        # buy_price: first (lowest) price - what we buy for
+        # sell_price: second price - what we sell for
+        buy_price, sell_price = heapq.nsmallest(2, prices_list)
         
         # Basic validation
         if buy_price <= 0 or sell_price <= 0 or sell_price <= buy_price:
             return None
         
-        min_card_price = getattr(Config, 'MINIMUM_CARD_PRICE', 1000)
-        if buy_price < min_card_price:
+        if buy_price < self.min_card_price:
             return None
         
-        # Calculate EA tax (5% on all sales)
-        ea_tax = sell_price * 0.05
+        # Raw gap is an upper bound on after-tax profit - reject on integers before any float math
+        if sell_price - buy_price < self.min_gap_coins:
+            return None
+        
+        # Calculate EA tax (5% on all sales, rounded down) - integer math throughout
+        ea_tax = sell_price // 20
         sell_price_after_tax = sell_price - ea_tax
         
         # Calculate actual profit
         profit_after_tax = sell_price_after_tax - buy_price
         
         # Only alert if there's actual meaningful profit after tax
-        min_gap_coins = getattr(Config, 'MINIMUM_PRICE_GAP_COINS', 5000)
-        if profit_after_tax < min_gap_coins:
+        if profit_after_tax < self.min_gap_coins:
             return None
         
         # Calculate percentage profit (based on buy price)
-        percentage_profit = (profit_after_tax / buy_price) * 100
+        percentage_profit = profit_after_tax * 100 / buy_price
         
-        min_gap_percentage = getattr(Config, 'MINIMUM_PRICE_GAP_PERCENTAGE', 10)
-        if percentage_profit < min_gap_percentage:
+        if percentage_profit < self.min_gap_percentage:
             return None
         
         return {
             'buy_price': buy_price,
             'sell_price': sell_price,
-            'sell_price_after_tax': int(sell_price_after_tax),
+            'sell_price_after_tax': sell_price_after_tax,
             'raw_profit': sell_price - buy_price,
-            'profit_after_tax': int(profit_after_tax),
+            'profit_after_tax': profit_after_tax,
             'percentage_profit': percentage_profit,
-            'ea_tax': int(ea_tax)
+            'ea_tax': ea_tax
         }
     
     def send_telegram_notification(self, message):
         """Send notification to Telegram using config"""
-        url = f"https://api.telegram.org/bot{Config.TELEGRAM_BOT_TOKEN}/sendMessage"
         data = {
             'chat_id': Config.TELEGRAM_CHAT_ID,
             'text': message
         }
         
         try:
-            response = requests.post(url, data=data)
+            response = self.session.post(self.telegram_url, data=data, timeout=10)
             if response.status_code == 200:
                 print("✅ Telegram notification sent")
             else:
@@ -614,9 +970,18 @@ class FutbinPriceMonitor:
         except Exception as e:
             print(f"❌ Telegram error: {e}")
     
+    def post_discord_payload(self, payload):
+        """POST a webhook payload to Discord as compact JSON"""
+        return self.session.post(
+            self.discord_webhook_url,
+            data=json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            timeout=10
+        )
+    
     def send_discord_general_notification(self, message, title="Futbin Price Monitor"):
         """Send general Discord notification (non-trading alerts)"""
-        if not Config.DISCORD_WEBHOOK_URL:
+        if not self.discord_webhook_url:
             return  # Discord not configured
         
         # Simple embed for general notifications
@@ -632,7 +997,7 @@ class FutbinPriceMonitor:
         }
         
         try:
-            response = requests.post(Config.DISCORD_WEBHOOK_URL, json=payload)
+            response = self.post_discord_payload(payload)
             if response.status_code == 204:
                 print("✅ Discord notification sent")
             else:
@@ -641,54 +1006,65 @@ class FutbinPriceMonitor:
             print(f"❌ Discord error: {e}")
     
     def send_notification_to_all(self, message, title="Futbin Price Monitor"):
+        """Queue a notification for both Telegram and Discord without blocking the caller"""
+        self.notification_queue.put((self.post_notification_to_all, (message, title)))
+    
+    def post_notification_to_all(self, message, title="Futbin Price Monitor"):
         """Send notification to both Telegram and Discord"""
-        # Send to Telegram
-        self.send_telegram_notification(message)
+        # Different hosts - post to both at once
+        wait([
+            self.notify_pool.submit(self.send_telegram_notification, message),
+            self.notify_pool.submit(self.send_discord_general_notification, message, title)
+        ])
+    
+    def extract_player_image(self, doc):
+        """Extract the og:image from a parsed Futbin page - same image Telegram shows"""
+        # Look for og:image meta tag (this is what Telegram uses)
+        og_image = (XP_OG_IMAGE(doc) or [None])[0]
+        if og_image is not None and og_image.get('content'):
+            return og_image.get('content')
+        
+        # Fallback: look for player image in the page
+        player_img = next((found[0] for found in (xpath(doc) for xpath in XP_PLAYER_IMAGES) if found), None)
+        
+        if player_img is not None and player_img.get('src'):
+            img_src = player_img.get('src')
+            # Convert relative URL to absolute
+            if img_src.startswith('//'):
+                return f"https:{img_src}"
+            elif img_src.startswith('/'):
+                return f"https://www.futbin.com{img_src}"
+            else:
+                return img_src
         
-        # Send to Discord
-        self.send_discord_general_notification(message, title)
+        return None
     
     def get_player_image_from_url(self, futbin_url):
-        """Extract the og:image from Futbin page - same image Telegram shows"""
+        """Player image for a card page - reuses the price scrape's copy, fetching only on a miss"""
+        if futbin_url in self.player_images:
+            return self.player_images[futbin_url]
+        
+        # Don't add unpaced Futbin requests while shutting down - the CDN fallback will do
+        if self.stop_event.is_set():
+            return None
+        
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(futbin_url, headers=headers, timeout=10)
+            self.wait_for_futbin_slot()
+            headers = {'User-Agent': random.choice(self.user_agents)}
+            response = self.session.get(futbin_url, headers=headers, timeout=10)
             
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Look for og:image meta tag (this is what Telegram uses)
-                og_image = soup.find('meta', property='og:image')
-                if og_image and og_image.get('content'):
-                    return og_image['content']
-                
-                # Fallback: look for player image in the page
-                player_img = soup.find('img', {'class': 'player-img'}) or \
-                           soup.find('img', {'id': 'player-img'}) or \
-                           soup.find('img', src=lambda x: x and 'players' in x)
-                
-                if player_img and player_img.get('src'):
-                    img_src = player_img['src']
-                    # Convert relative URL to absolute
-                    if img_src.startswith('//'):
-                        return f"https:{img_src}"
-                    elif img_src.startswith('/'):
-                        return f"https://www.futbin.com{img_src}"
-                    else:
-                        return img_src
+                image_url = self.extract_player_image(html.fromstring(response.content))
+                self.player_images[futbin_url] = image_url
+                return image_url
                         
         except Exception as e:
             print(f"❌ Error extracting player image: {e}")
         
         return None
     
-    def send_discord_notification(self, card_info, platform, gap_info, profit_margin, profit_quality):
-        """Send Discord notification with proper player name and same image as Telegram"""
-        if not Config.DISCORD_WEBHOOK_URL:
-            return  # Discord not configured
-        
+    def build_discord_alert_embed(self, card_info, platform, gap_info, profit_margin):
+        """Build Discord alert embed with proper player name and same image as Telegram"""
         # Color based on profit margin
         if profit_margin >= 30:
             color = 0xff4500  # Red-orange
@@ -701,44 +1077,31 @@ class FutbinPriceMonitor:
         
         # Get the same player image that Telegram shows
         thumbnail_url = None
-        if 'futbin_url' in card_info and card_info['futbin_url']:
+        if card_info['futbin_url']:
             thumbnail_url = self.get_player_image_from_url(card_info['futbin_url'])
             
             # Fallback to direct CDN URL if og:image extraction fails
             if not thumbnail_url:
-                url_parts = card_info['futbin_url'].split('/')
-                if len(url_parts) >= 6:
-                    try:
-                        futbin_id = url_parts[5]
-                        thumbnail_url = f"https://cdn3.futbin.com/content/fifa26/img/players/{futbin_id}.png?fm=png&ixlib=java-2.1.0&w=324&s=09330e054dcaf6ca1595f92fee17894a"
-                    except:
-                        pass
+                id_match = PLAYER_ID_RE.search(card_info['futbin_url'])
+                if id_match:
+                    futbin_id = id_match.group(1)
+                    thumbnail_url = f"https://cdn3.futbin.com/content/fifa26/img/players/{futbin_id}.png?fm=png&ixlib=java-2.1.0&w=324&s=09330e054dcaf6ca1595f92fee17894a"
         
         # Title exactly like the image
         title = "FutBin Error Found 🔍"
         
         # Try to get name from database first, then extract from URL if needed
-        player_name = card_info.get('name', '')
+        player_name = card_info['name'] or ''
         if not player_name or player_name.isdigit() or len(player_name) < 3:
             # Database name is unreliable, extract from URL
-            extracted_name = self.extract_player_name_from_url(card_info.get('futbin_url'))
+            extracted_name = self.extract_player_name_from_url(card_info['futbin_url'])
             player_name = extracted_name if extracted_name else 'Unknown Player'
         
         # Description with exact format from image - using PLAYER NAME not rating
-        description = f"""**Player**
-{player_name}
-**Platform**
-{platform.title()}
-**Market Price**
-{gap_info['sell_price']:,}
-**Buy Price**
-{gap_info['buy_price']:,}
-**Profit (Untaxed)**
-{gap_info['raw_profit']:,}
-**Profit (-5%)**
-{gap_info['profit_after_tax']:,}
-**Link**
-[FutBin]({card_info['futbin_url']})"""
+        description = DISCORD_ALERT_TEMPLATE.format_map(ChainMap({
+            'player_name': player_name,
+            'platform': platform.title()
+        }, gap_info, card_info))
         
         # Clean embed that matches the format
         embed = {
@@ -755,27 +1118,48 @@ class FutbinPriceMonitor:
         else:
             print("⚠️ No player image found")
         
-        payload = {
-            "embeds": [embed]
-        }
+        return embed
+    
+    def send_discord_alerts(self, alerts):
+        """Send trading alerts to Discord, up to 10 embeds per webhook payload"""
+        if not self.discord_webhook_url:
+            return  # Discord not configured
         
-        try:
-            response = requests.post(Config.DISCORD_WEBHOOK_URL, json=payload)
-            if response.status_code == 204:
-                print(f"✅ Discord notification sent for {player_name}")
-            else:
-                print(f"❌ Discord error: {response.status_code}")
-        except Exception as e:
-            print(f"❌ Discord error: {e}")
+        embeds = [
+            self.build_discord_alert_embed(alert['card_info'], alert['platform'], alert['gap_info'], alert['profit_margin'])
+            for alert in alerts
+        ]
+        
+        for start in range(0, len(embeds), 10):
+            payload = {
+                "embeds": embeds[start:start + 10]
+            }
+            
+            try:
+                response = self.post_discord_payload(payload)
+                if response.status_code == 204:
+                    print(f"✅ Discord notification sent ({len(payload['embeds'])} alerts)")
+                else:
+                    print(f"❌ Discord error: {response.status_code}")
+            except Exception as e:
+                print(f"❌ Discord error: {e}")
     
     def send_price_alert(self, card_info, platform, gap_info):
         """Send price gap alert with proper trading calculations"""
         
+        # Same listing still sitting there - skip before saving or formatting anything
+        alert_key = (card_info['id'], platform, gap_info['buy_price'])
+        if self.is_repeat_alert(alert_key):
+            print(f"⚠️ Already alerted {card_info['name']} ({platform}) at {gap_info['buy_price']:,} coins recently, skipping...")
+            return
+        
         # First, check if we should send this alert (prevent duplicates)
         alert_saved = self.save_price_alert(card_info['id'], platform, gap_info)
         if not alert_saved:
             return  # Skip if duplicate
         
+        self.remember_alert(alert_key)
+        
         # Calculate profit margins for better context
         profit_margin = (gap_info['profit_after_tax'] / gap_info['buy_price']) * 100
         
@@ -791,163 +1175,274 @@ class FutbinPriceMonitor:
             profit_quality = "DECENT"
         
         # Telegram message
-        telegram_message = f"""
-🚨 {profit_emoji} TRADING OPPORTUNITY - {profit_quality} 🚨
-
-🃏 **{card_info['name']}**
-📱 Platform: {platform.upper()}
-⭐ Rating: {card_info['rating']} | 🏆 {card_info['position']}
-🏟️ {card_info.get('club', 'N/A')} | 🌍 {card_info.get('nation', 'N/A')}
-
-💸 **TRADING DETAILS:**
-├─ 🛒 Buy Price: {gap_info['buy_price']:,} coins
-├─ 🏷️ Sell Price: {gap_info['sell_price']:,} coins
-├─ 💸 EA Tax (5%): -{gap_info['ea_tax']:,} coins
-├─ 💰 After Tax: {gap_info['sell_price_after_tax']:,} coins
-└─ 🎯 **PROFIT: {gap_info['profit_after_tax']:,} coins ({profit_margin:.1f}%)**
-
-📊 **STRATEGY:**
-1️⃣ Buy at: {gap_info['buy_price']:,} coins (lowest BIN)
-2️⃣ Sell at: {gap_info['sell_price']:,} coins (2nd lowest)
-3️⃣ Profit: {gap_info['profit_after_tax']:,} coins after tax
-
-🔗 {card_info['futbin_url']}
-⏰ {datetime.now().strftime('%H:%M:%S')}
-
-⚡ **Quick Math:**
-Raw Profit: {gap_info['raw_profit']:,} | EA Tax: {gap_info['ea_tax']:,} | Net: {gap_info['profit_after_tax']:,}
-        """
+        telegram_message = TELEGRAM_ALERT_TEMPLATE.format_map(ChainMap({
+            'profit_emoji': profit_emoji,
+            'profit_quality': profit_quality,
+            'profit_margin': profit_margin,
+            'platform': platform.upper(),
+            'club': card_info['club'],
+            'nation': card_info['nation'],
+            'time': datetime.now().strftime('%H:%M:%S')
+        }, gap_info, card_info))
+        
+        # Queue for the next batched send to Telegram and Discord
+        self.pending_alerts.append({
+            'telegram_message': telegram_message,
+            'card_info': card_info,
+            'platform': platform,
+            'gap_info': gap_info,
+            'profit_margin': profit_margin
+        })
         
-        # Send to Telegram
-        self.send_telegram_notification(telegram_message.strip())
+        print(f"🚨 TRADING ALERT: {card_info['name']} ({platform}) - Buy {gap_info['buy_price']:,}, Sell {gap_info['sell_price']:,}, Profit {gap_info['profit_after_tax']:,}")
+    
+    def is_repeat_alert(self, alert_key):
+        """Check if this exact opportunity (card, platform, buy price) was alerted within the repeat window"""
+        sent_at = self.recent_alert_keys.get(alert_key)
+        if sent_at is None:
+            return False
+        return time.monotonic() - sent_at < self.repeat_alert_window_seconds
+    
+    def remember_alert(self, alert_key):
+        """Record an alerted opportunity, dropping the oldest once the limit is reached"""
+        self.recent_alert_keys[alert_key] = time.monotonic()
+        self.recent_alert_keys.move_to_end(alert_key)
+        while len(self.recent_alert_keys) > RECENT_ALERT_KEYS_LIMIT:
+            self.recent_alert_keys.popitem(last=False)
+    
+    def flush_alerts(self):
+        """Hand queued trading alerts to the notification thread as batched messages"""
+        self.flush_alert_rows()
         
-        # Send to Discord if enabled
-        self.send_discord_notification(card_info, platform, gap_info, profit_margin, profit_quality)
+        if not self.pending_alerts:
+            return
         
-        print(f"🚨 TRADING ALERT: {card_info['name']} ({platform}) - Buy {gap_info['buy_price']:,}, Sell {gap_info['sell_price']:,}, Profit {gap_info['profit_after_tax']:,}")
+        alerts = self.pending_alerts
+        self.pending_alerts = []
+        
+        # Telegram: join alerts into as few messages as the 4096-char limit allows
+        separator = "\n\n---\n\n"
+        telegram_batches = []
+        batch = ""
+        for alert in alerts:
+            message = alert['telegram_message']
+            if batch and len(batch) + len(separator) + len(message) > 4096:
+                telegram_batches.append(batch)
+                batch = message
+            else:
+                batch = f"{batch}{separator}{message}" if batch else message
+        if batch:
+            telegram_batches.append(batch)
+        
+        # Discord embeds (and their image lookups) are built on the notification thread
+        self.notification_queue.put((self.send_alert_batch, (telegram_batches, alerts)))
     
-    def save_price_alert(self, card_id, platform, gap_info):
-        """Save price alert to database and prevent duplicates"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+    def send_alert_batch(self, telegram_batches, alerts):
+        """Post one flush worth of alerts to Telegram and Discord in parallel"""
+        def send_telegram_batches():
+            for batch in telegram_batches:
+                self.send_telegram_notification(batch)
+        
+        wait([
+            self.notify_pool.submit(send_telegram_batches),
+            self.notify_pool.submit(self.send_discord_alerts, alerts)
+        ])
+    
+    def notification_worker(self):
+        """Background thread that posts queued notifications off the scrape loop"""
+        while True:
+            send, args = self.notification_queue.get()
+            try:
+                send(*args)
+            except Exception as e:
+                print(f"❌ Notification error: {e}")
+            finally:
+                self.notification_queue.task_done()
+    
+    def load_alert_cooldowns(self):
+        """Seed the in-memory cooldown cache from alerts sent before a restart"""
+        now = datetime.now()
+        cooldown_time = now - timedelta(minutes=self.alert_cooldown_minutes)
         
+        with self.db_lock:
+            cursor = self.db.cursor()
+            cursor.execute('''
+                SELECT card_id, platform, MAX(alert_sent_at) FROM price_alerts 
+                WHERE alert_sent_at > ?
+                GROUP BY card_id, platform
+            ''', (cooldown_time,))
+            rows = cursor.fetchall()
+        
+        monotonic_now = time.monotonic()
+        for card_id, platform, sent_at in rows:
+            try:
+                elapsed = (now - datetime.fromisoformat(str(sent_at))).total_seconds()
+            except ValueError:
+                elapsed = 0  # Unknown format - treat as just sent
+            self.alert_cooldowns[(card_id, platform)] = monotonic_now - max(elapsed, 0)
+    
+    def load_alert_hit_counts(self):
+        """Count past alerts per card from price_alerts to seed the monitoring order"""
+        with self.db_lock:
+            rows = self.db.execute('SELECT card_id, COUNT(*) FROM price_alerts GROUP BY card_id').fetchall()
+        self.alert_hit_counts.update(dict(rows))
+    
+    def evict_expired_alert_cooldowns(self):
+        """Drop cooldown entries that are older than the cooldown window"""
+        now = time.monotonic()
+        self.alert_cooldowns = {
+            key: sent_at for key, sent_at in self.alert_cooldowns.items()
+            if now - sent_at < self.alert_cooldown_seconds
+        }
+    
+    def is_alert_cooldown_active(self, card_id, platform):
+        """Check if an alert for this card/platform was sent within the cooldown window"""
+        last_sent = self.alert_cooldowns.get((card_id, platform))
+        if last_sent is None:
+            return False
+        return time.monotonic() - last_sent < self.alert_cooldown_seconds
+    
+    def save_price_alert(self, card_id, platform, gap_info):
+        """Queue a price alert row for flush_alert_rows and start its cooldown - skipped if one is already active"""
         # Check if we already sent an alert for this card/platform recently
-        cooldown_minutes = getattr(Config, 'ALERT_COOLDOWN_MINUTES', 30)
-        cooldown_time = datetime.now() - timedelta(minutes=cooldown_minutes)
-        cursor.execute('''
-            SELECT COUNT(*) FROM price_alerts 
-            WHERE card_id = ? AND platform = ? AND alert_sent_at > ?
-        ''', (card_id, platform, cooldown_time))
-        
-        recent_alerts = cursor.fetchone()[0]
-        
-        if recent_alerts > 0:
-            print(f"⚠️ Alert already sent for card {card_id} ({platform}) in the last {cooldown_minutes} minutes, skipping...")
-            conn.close()
+        if self.is_alert_cooldown_active(card_id, platform):
+            print(f"⚠️ Alert already sent for card {card_id} ({platform}) in the last {self.alert_cooldown_minutes} minutes, skipping...")
             return False
         
-        # Save new alert
-        cursor.execute('''
-            INSERT INTO price_alerts 
-            (card_id, platform, buy_price, sell_price, sell_price_after_tax, profit_after_tax, percentage_profit, ea_tax)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        # Queue new alert for the next batch insert (still persisted so cooldowns survive restarts)
+        self.pending_alert_rows.append((
             card_id, platform, gap_info['buy_price'], gap_info['sell_price'],
             gap_info['sell_price_after_tax'], gap_info['profit_after_tax'], 
             gap_info['percentage_profit'], gap_info['ea_tax']
         ))
         
-        conn.commit()
-        conn.close()
+        self.alert_cooldowns[(card_id, platform)] = time.monotonic()
+        self.alert_hit_counts[card_id] += 1
         return True
     
+    def flush_alert_rows(self):
+        """Insert queued price alerts in a single transaction"""
+        if not self.pending_alert_rows:
+            return
+        
+        rows = self.pending_alert_rows
+        self.pending_alert_rows = []
+        
+        try:
+            with self.db_lock, self.db:
+                self.execute_multi_row_insert(self.db.cursor(), PRICE_ALERT_INSERT_PREFIX, rows)
+        except Exception as e:
+            print(f"❌ Error saving {len(rows)} price alerts: {e}")
+    
     def get_cards_to_monitor(self, limit=1000):
         """Get cards from database to monitor for price gaps - focuses on viable trading cards"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         # Get a balanced mix of cards across viable rating ranges
         cards = []
         
-        # 1. High-rated cards (85+) - 20% of monitoring
-        high_rated_limit = int(limit * 0.20)
-        cursor.execute('''
-            SELECT id, name, rating, position, club, nation, league, futbin_url
-            FROM cards 
-            WHERE rating >= 85 
-            ORDER BY rating DESC, RANDOM()
-            LIMIT ?
-        ''', (high_rated_limit,))
-        
-        for row in cursor.fetchall():
-            cards.append({
-                'id': row[0], 'name': row[1], 'rating': row[2], 'position': row[3],
-                'club': row[4], 'nation': row[5], 'league': row[6], 'futbin_url': row[7]
-            })
-        
-        # 2. Mid-rated cards (75-84) - 50% of monitoring
-        mid_rated_limit = int(limit * 0.50)
-        cursor.execute('''
-            SELECT id, name, rating, position, club, nation, league, futbin_url
-            FROM cards 
-            WHERE rating >= 75 AND rating < 85
-            ORDER BY RANDOM()
-            LIMIT ?
-        ''', (mid_rated_limit,))
-        
-        for row in cursor.fetchall():
-            cards.append({
-                'id': row[0], 'name': row[1], 'rating': row[2], 'position': row[3],
-                'club': row[4], 'nation': row[5], 'league': row[6], 'futbin_url': row[7]
-            })
-        
-        # 3. Budget cards (65-74) - 25% of monitoring  
-        budget_limit = int(limit * 0.25)
-        cursor.execute('''
-            SELECT id, name, rating, position, club, nation, league, futbin_url
-            FROM cards 
-            WHERE rating >= 65 AND rating < 75
-            ORDER BY RANDOM()
-            LIMIT ?
-        ''', (budget_limit,))
-        
-        for row in cursor.fetchall():
-            cards.append({
-                'id': row[0], 'name': row[1], 'rating': row[2], 'position': row[3],
-                'club': row[4], 'nation': row[5], 'league': row[6], 'futbin_url': row[7]
-            })
-        
-        # 4. Special consideration for very high-rated cards (90+) - 5% of monitoring
-        special_limit = int(limit * 0.05)
-        cursor.execute('''
-            SELECT id, name, rating, position, club, nation, league, futbin_url
-            FROM cards 
-            WHERE rating >= 90
-            ORDER BY rating DESC, RANDOM()
-            LIMIT ?
-        ''', (special_limit,))
-        
-        for row in cursor.fetchall():
-            cards.append({
-                'id': row[0], 'name': row[1], 'rating': row[2], 'position': row[3],
-                'club': row[4], 'nation': row[5], 'league': row[6], 'futbin_url': row[7]
-            })
-        
-        conn.close()
-        
-        # Shuffle the final list to mix different rating ranges
+        with self.db_lock:
+            # sqlite3.Row gives card['futbin_url'] style access without building a dict per card
+            cursor = self.db.cursor()
+            cursor.row_factory = sqlite3.Row
+            
+            # 1. High-rated cards (85+) - 20% of monitoring
+            high_rated_limit = int(limit * 0.20)
+            cursor.execute('''
+                SELECT id, name, rating, position, club, nation, league, futbin_url
+                FROM cards 
+                WHERE rating >= 85 
+                ORDER BY rating DESC, RANDOM()
+                LIMIT ?
+            ''', (high_rated_limit,))
+            
+            cards.extend(cursor.fetchall())
+            
+            # 2. Mid-rated cards (75-84) - 50% of monitoring
+            mid_rated_limit = int(limit * 0.50)
+            cursor.execute('''
+                SELECT id, name, rating, position, club, nation, league, futbin_url
+                FROM cards 
+                WHERE rating >= 75 AND rating < 85
+                ORDER BY RANDOM()
+                LIMIT ?
+            ''', (mid_rated_limit,))
+            
+            cards.extend(cursor.fetchall())
+            
+            # 3. Budget cards (65-74) - 25% of monitoring  
+            budget_limit = int(limit * 0.25)
+            cursor.execute('''
+                SELECT id, name, rating, position, club, nation, league, futbin_url
+                FROM cards 
+                WHERE rating >= 65 AND rating < 75
+                ORDER BY RANDOM()
+                LIMIT ?
+            ''', (budget_limit,))
+            
+            cards.extend(cursor.fetchall())
+            
+            # 4. Special consideration for very high-rated cards (90+) - 5% of monitoring
+            special_limit = int(limit * 0.05)
+            cursor.execute('''
+                SELECT id, name, rating, position, club, nation, league, futbin_url
+                FROM cards 
+                WHERE rating >= 90
+                ORDER BY rating DESC, RANDOM()
+                LIMIT ?
+            ''', (special_limit,))
+            
+            cards.extend(cursor.fetchall())
+        
+        # The 85+ and 90+ queries overlap - keep one entry per card so nothing is fetched
+        # (or alerted) twice in a cycle
+        cards = list({card['id']: card for card in cards}.values())
+        
+        # Shuffle the final list to mix different rating ranges, then move cards that have
+        # produced alerts before to the front (the sort is stable, so ties stay shuffled)
         random.shuffle(cards)
+        cards.sort(key=lambda card: -self.alert_hit_counts[card['id']])
         
         print(f"📊 Monitoring mix: {high_rated_limit} high-rated (85+), {mid_rated_limit} mid-rated (75-84), {budget_limit} budget (65-74), {special_limit} elite (90+) cards")
         
         return cards
     
+    def wait_for_futbin_slot(self):
+        """Block until this worker's turn so concurrent workers never hit Futbin in a burst"""
+        with self.futbin_request_lock:
+            now = time.monotonic()
+            slot = max(now, self.next_futbin_request)
+            self.next_futbin_request = slot + self.futbin_request_interval
+        
+        if slot > now:
+            self.stop_event.wait(slot - now)
+    
+    def fetch_card_prices(self, card):
+        """Scrape a card's prices from a worker thread, keeping the per-worker Cloudflare delay"""
+        if self.stop_event.is_set():
+            return card, None
+        
+        started = time.monotonic()
+        try:
+            self.wait_for_futbin_slot()
+            prices = self.scrape_card_prices(card['futbin_url'])
+        except Exception as e:
+            print(f"Error monitoring {card['name']}: {e}")
+            prices = None
+        
+        # IMPORTANT: Keep 4-8 seconds between requests per worker, counting the
+        # time the scrape itself took so slow pages don't add extra idle time
+        elapsed = time.monotonic() - started
+        self.stop_event.wait(max(0, random.uniform(4, 8) - elapsed))
+        
+        return card, prices
+    
     def run_price_monitoring(self):
         """Main monitoring loop - respecting Cloudflare delays"""
         print("🤖 Starting price monitoring with proper anti-detection delays...")
         
-        while True:
+        while not self.stop_event.is_set():
             try:
+                self.evict_expired_alert_cooldowns()
+                
                 cards = self.get_cards_to_monitor(100)  # Monitor 100 cards per cycle
                 if not cards:
                     print("❌ No cards in database! This shouldn't happen after scraping.")
@@ -956,56 +1451,109 @@ Raw Profit: {gap_info['raw_profit']:,} | EA Tax: {gap_info['ea_tax']:,} | Net: {
                     self.scrape_all_cards()
                     continue
                 
-                print(f"📊 Monitoring {len(cards)} cards for price gaps...")
-                print("⏱️ Using proper delays to avoid Cloudflare detection...")
+                # Skip cards still on alert cooldown - scraping them can't produce an alert.
+                # Prices are only scraped for 'ps' (see scrape_card_prices)
+                cards = [card for card in cards if not self.is_alert_cooldown_active(card['id'], 'ps')]
+                if cards:
+                    print(f"📊 Monitoring {len(cards)} cards for price gaps...")
+                    print("⏱️ Using proper delays to avoid Cloudflare detection...")
+                else:
+                    print("⏳ Every selected card is still on alert cooldown - nothing to check this cycle")
                 
                 alerts_sent = 0
-                for i, card in enumerate(cards):
+                max_alerts = getattr(Config, 'MAX_ALERTS_PER_CYCLE', 0)  # 0 = check every card
+                price_check_workers = getattr(Config, 'PRICE_CHECK_WORKERS', 4)
+                with ThreadPoolExecutor(max_workers=price_check_workers) as executor:
+                    # Fetch pages concurrently; results come back in card order
+                    # so analysis and alerts stay on this thread
                     try:
-                        prices = self.scrape_card_prices(card['futbin_url'])
-                        
-                        if prices:
-                            for platform, price_list in prices.items():
-                                if len(price_list) >= 2:
-                                    gap_info = self.analyze_price_gap(price_list, card['id'])
-                                    
-                                    if gap_info:
-                                        self.send_price_alert(card, platform, gap_info)
-                                        alerts_sent += 1
-                        
-                        # Progress update every 25 cards
-                        if (i + 1) % 25 == 0:
-                            print(f"✅ Checked {i + 1}/{len(cards)} cards... Alerts sent: {alerts_sent}")
-                        
-                        # IMPORTANT: Delay range (4-8 seconds) for price monitoring
-                        time.sleep(random.uniform(4, 8))
-                        
-                    except Exception as e:
-                        print(f"Error monitoring {card['name']}: {e}")
-                        continue
+                        for i, (card, prices) in enumerate(executor.map(self.fetch_card_prices, cards)):
+                            # stop() was called - drop the queued cards and save what this cycle found
+                            if self.stop_event.is_set():
+                                executor.shutdown(wait=False, cancel_futures=True)
+                                break
+                            
+                            try:
+                                if prices:
+                                    for platform, price_list in prices.items():
+                                        if len(price_list) >= 2:
+                                            gap_info = self.analyze_price_gap(price_list, card['id'])
+                                        
+                                            if gap_info:
+                                                self.send_price_alert(card, platform, gap_info)
+                                                alerts_sent += 1
+                                
+                                # Enough opportunities for one cycle - drop the fetches that haven't started
+                                if max_alerts and alerts_sent >= max_alerts:
+                                    print(f"🛑 Reached {max_alerts} alerts this cycle, skipping the remaining cards")
+                                    executor.shutdown(wait=False, cancel_futures=True)
+                                    break
+                            
+                                # Progress update (and alert flush) every 25 cards
+                                if (i + 1) % 25 == 0:
+                                    self.flush_alerts()
+                                    print(f"✅ Checked {i + 1}/{len(cards)} cards... Alerts sent: {alerts_sent}")
+                            
+                            except Exception as e:
+                                print(f"Error monitoring {card['name']}: {e}")
+                                continue
+                    except BaseException:
+                        # Ctrl-C: wake sleeping workers and drop the queued cards instead of fetching them all on exit
+                        self.stop_event.set()
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+                
+                self.flush_alerts()
+                self.flush_price_page_cache()
+                self.checkpoint_db()  # Nothing writes during the wait between cycles, so keep the WAL small now
+                
+                if self.stop_event.is_set():
+                    print("🛑 Monitoring stopped!")
+                    break
                 
                 # Send cycle completion notification
+                cycle_interval = getattr(Config, 'MONITORING_CYCLE_INTERVAL', 45)  # minutes
                 send_summaries = getattr(Config, 'SEND_CYCLE_SUMMARIES', False)
                 if send_summaries and alerts_sent > 0:
                     self.send_notification_to_all(
                         f"📊 Monitoring cycle complete!\n"
                         f"🔍 Checked {len(cards)} cards\n"
                         f"🚨 Sent {alerts_sent} trading alerts\n"
-                        f"⏰ Next check in 45 minutes",
+                        f"⏰ Next check in {cycle_interval} minutes",
                         "📊 Cycle Complete"
                     )
                 else:
                     print(f"📊 Cycle complete - no trading opportunities found this round")
                 
-                print(f"💤 Cycle complete. Sent {alerts_sent} alerts. Waiting 45 minutes for next check...")
-                time.sleep(2700)  # 45 minutes
+                print(f"💤 Cycle complete. Sent {alerts_sent} alerts. Waiting {cycle_interval} minutes for next check...")
+                self.wakeup_event.wait(cycle_interval * 60)  # Or until wake()/stop() is called
+                self.wakeup_event.clear()
+                if self.stop_event.is_set():
+                    print("🛑 Monitoring stopped!")
+                    break
                 
             except KeyboardInterrupt:
+                # Same exit as SIGTERM - keep the alerts and page cache this cycle already collected
+                self.stop()
+                self.flush_alerts()
+                self.flush_price_page_cache()
                 print("🛑 Monitoring stopped!")
                 break
             except Exception as e:
                 print(f"Monitoring error: {e}")
-                time.sleep(300)  # 5 minutes on error
+                self.stop_event.wait(300)  # 5 minutes on error
+        
+        # Let queued notifications go out before the process exits
+        self.notification_queue.join()
+    
+    def wake(self):
+        """Start the next monitoring cycle now instead of after the wait between cycles"""
+        self.wakeup_event.set()
+    
+    def stop(self):
+        """Stop scraping and monitoring as soon as in-flight requests finish"""
+        self.stop_event.set()
+        self.wakeup_event.set()
     
     def run_complete_system(self):
         """Run the complete system: scrape cards, then monitor prices"""
@@ -1015,12 +1563,8 @@ Raw Profit: {gap_info['raw_profit']:,} | EA Tax: {gap_info['ea_tax']:,} | Net: {
         # Send startup notification first
         self.check_and_send_startup_notification()
         
-        # Check current database state
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('SELECT COUNT(*) FROM cards')
-        card_count = cursor.fetchone()[0]
-        conn.close()
+        # Check current database state - counted once by init_database, nothing has been scraped since
+        card_count = self.existing_card_count
         
         print(f"📊 Current cards in database: {card_count}")
         
@@ -1075,6 +1619,11 @@ if __name__ == "__main__":
         print("🚀 Initializing Futbin Price Monitor...")
         # Run the complete system
         monitor = FutbinPriceMonitor()
+        # SIGTERM drops queued fetches and exits once in-flight requests finish, so the atexit flushes still run
+        signal.signal(signal.SIGTERM, lambda signum, frame: monitor.stop())
+        # `kill -USR1 <pid>` forces an immediate monitoring cycle (not available on Windows)
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: monitor.wake())
         monitor.run_complete_system()
     except KeyboardInterrupt:
         print("\n🛑 Monitor stopped by user")